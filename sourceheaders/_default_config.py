@@ -0,0 +1,98 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2022-2023 Jan Holthuis <jan.holthuis@rub.de>
+#
+# Permission is hereby granted, free of charge, to any person
+# obtaining a copy of this software and associated documentation files
+# (the "Software"), to deal in the Software without restriction,
+# including without limitation the rights to use, copy, modify, merge,
+# publish, distribute, sublicense, and/or sell copies of the Software,
+# and to permit persons to whom the Software is furnished to do so,
+# subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS
+# BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN
+# ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+# SPDX-License-Identifier: MIT
+
+"""
+Default configuration, generated from `default.toml`.
+
+Do not edit this file manually. Instead, edit the TOML file and run
+`tools/freeze_default_config.py` to regenerate it.
+"""
+# pylint: disable=line-too-long
+from typing import Any
+
+DEFAULT_CONFIG: dict[str, Any] = (
+    {'general': {'prefer_inline': False,
+                 'preserve_copyright_years': False,
+                 'preserve_copyright_holder': True,
+                 'preserve_license': True,
+                 'header_pattern': '(?:Copyright|\\(c\\)|All rights '
+                                   'reserved.|SPDX-License-Identifier:)',
+                 'header_head': '',
+                 'header_foot': '',
+                 'copyright_template': 'Copyright (c) {year} {copyright_holder}',
+                 'include_spdx_license_identifier': 'auto'},
+     'language': {'c': {'extensions': ['.c',
+                                       '.h',
+                                       '.cc',
+                                       '.cpp',
+                                       '.cxx',
+                                       '.hpp',
+                                       '.hxx'],
+                        'block_comment': {'start': '/* ', 'line': ' * ', 'end': ' */'},
+                        'inline_comment': '// '},
+                  'csharp': {'extensions': ['.cs'],
+                             'block_comment': {'start': '/* ',
+                                               'line': ' * ',
+                                               'end': ' */'},
+                             'inline_comment': '// '},
+                  'java': {'extensions': ['.java', '.scala', '.groovy'],
+                           'block_comment': {'start': '/* ',
+                                             'line': ' * ',
+                                             'end': ' */'},
+                           'inline_comment': '// '},
+                  'javascript': {'extensions': ['.js', '.jsx', '.mjs', '.ts', '.tsx'],
+                                 'block_comment': {'start': '/* ',
+                                                   'line': ' * ',
+                                                   'end': ' */'},
+                                 'inline_comment': '// ',
+                                 'skip_line': '^#!'},
+                  'perl': {'extensions': ['.pl'], 'inline_comment': '# '},
+                  'protobuf': {'extensions': ['.proto'],
+                               'block_comment': {'start': '/* ',
+                                                 'line': ' * ',
+                                                 'end': ' */'},
+                               'inline_comment': '// '},
+                  'python': {'extensions': ['.py'],
+                             'block_comment': {'start': '"""', 'end': '"""'},
+                             'inline_comment': '# ',
+                             'skip_line': '^#!|^# +-\\*-|^# '
+                                          '+(?:pylint|pyright|coding|encoding|type|flake8):',
+                             'prefer_inline': True},
+                  'ruby': {'extensions': ['.rb'],
+                           'block_comment': {'start': '=begin\n', 'end': '=end\n'},
+                           'inline_comment': '# ',
+                           'skip_line': '^#!'},
+                  'rust': {'extensions': ['.rs'],
+                           'block_comment': {'start': '/* ',
+                                             'line': ' * ',
+                                             'end': ' */'},
+                           'inline_comment': '// '},
+                  'shell': {'extensions': ['.sh', '.bash', '.csh', '.zsh', '.fish'],
+                            'inline_comment': '# ',
+                            'skip_line': '^#!'},
+                  'xml': {'extensions': ['.xml', '.xhtml'],
+                          'block_comment': {'start': '<!--', 'line': '', 'end': '-->'},
+                          'skip_line': '^\\s*<\\?xml.*\\?>'}}}
+)
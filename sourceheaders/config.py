@@ -24,48 +24,68 @@
 # SPDX-License-Identifier: MIT
 
 """ Configuration class. """
-import importlib.resources
+import copy
+import dataclasses
 import re
-from collections import ChainMap
-from typing import IO, Any, Mapping
-
-import toml
+import sys
+from typing import IO, Any, Mapping, Optional
 
+from ._default_config import DEFAULT_CONFIG
 from .parser import BlockComment, IncludeSpdxIdentifierOption, LanguageInfo
 
+INCLUDE_SPDX_IDENTIFIER_OPTIONS = {
+    option.value: option for option in IncludeSpdxIdentifierOption
+}
+
 
-def get_language_from_mapping(language_data: Mapping[str, Any]) -> LanguageInfo:
+def get_language_from_mapping(
+    language_data: Mapping[str, Any],
+    compiled_patterns: Optional[dict[str, re.Pattern[str]]] = None,
+) -> LanguageInfo:
     """
     Return a `LanguageInfo` object for the given mapping.
+
+    If `compiled_patterns` is given, it is used to cache the compiled regular
+    expressions across calls.
     """
-    block_comment = None
-    try:
-        block_comment_data = language_data["block_comment"]
-    except KeyError:
-        pass
-    else:
-        if block_comment_data is not None:
-            block_comment_start = block_comment_data.get("start")
-            block_comment_line = block_comment_data.get("line")
-            block_comment_end = block_comment_data.get("end")
-            if block_comment_start or block_comment_line or block_comment_end:
-                block_comment = BlockComment(
-                    start=block_comment_start,
-                    line=block_comment_line,
-                    end=block_comment_end,
-                )
+    if compiled_patterns is None:
+        compiled_patterns = {}
 
-    try:
-        skip_line = re.compile(language_data["skip_line"])
-    except KeyError:
-        skip_line = None
+    block_comment = None
+    block_comment_data = language_data.get("block_comment")
+    if block_comment_data is not None:
+        block_comment_start = block_comment_data.get("start")
+        block_comment_line = block_comment_data.get("line")
+        block_comment_end = block_comment_data.get("end")
+        if block_comment_start or block_comment_line or block_comment_end:
+            block_comment = BlockComment(
+                start=block_comment_start,
+                line=block_comment_line,
+                end=block_comment_end,
+            )
+
+    skip_line = compiled_patterns.get("skip_line")
+    if skip_line is None and (skip_line_value := language_data.get("skip_line")):
+        skip_line = re.compile(skip_line_value)
+        compiled_patterns["skip_line"] = skip_line
+
+    header_pattern = compiled_patterns.get("header_pattern")
+    if header_pattern is None:
+        header_pattern = re.compile(language_data["header_pattern"])
+        compiled_patterns["header_pattern"] = header_pattern
 
     include_spdx_license_identifier_value = language_data.get(
         "include_spdx_license_identifier", "auto"
     )
-    include_spdx_license_identifier = IncludeSpdxIdentifierOption(
-        include_spdx_license_identifier_value
-    )
+    try:
+        include_spdx_license_identifier = INCLUDE_SPDX_IDENTIFIER_OPTIONS[
+            include_spdx_license_identifier_value
+        ]
+    except KeyError as exc:
+        raise ValueError(
+            "Invalid value for include_spdx_license_identifier: "
+            f"{include_spdx_license_identifier_value}"
+        ) from exc
 
     return LanguageInfo(
         block_comment=block_comment,
@@ -76,7 +96,7 @@ def get_language_from_mapping(language_data: Mapping[str, Any]) -> LanguageInfo:
         preserve_copyright_years=bool(language_data["preserve_copyright_years"]),
         preserve_copyright_holder=bool(language_data["preserve_copyright_holder"]),
         preserve_license=bool(language_data["preserve_license"]),
-        header_pattern=re.compile(language_data["header_pattern"]),
+        header_pattern=header_pattern,
         header_head=language_data.get("header_head", ""),
         header_foot=language_data.get("header_foot", ""),
         copyright_template=language_data["copyright_template"],
@@ -93,6 +113,8 @@ class Config:
 
     def __init__(self):
         self._extensions: dict[str, str] = {}
+        self._compiled_patterns: dict[str, dict[str, re.Pattern[str]]] = {}
+        self._languages: dict[str, LanguageInfo] = {}
         self._config: dict[str, dict[str, Any]] = {
             "general": {},
             "language": {},
@@ -100,39 +122,45 @@ class Config:
 
     def read(self, path: str):
         """Read a config file from `path`."""
-        with open(path, mode="r", encoding="utf-8") as fp:
+        with open(path, mode="rb") as fp:
             self.readfp(fp)
 
     def read_default(self):
         """Read the default config."""
-        ref = importlib.resources.files(__package__).joinpath("default.toml")
-        with ref.open("r", encoding="utf-8") as fp:
-            self.readfp(fp)
+        self._read_data(copy.deepcopy(DEFAULT_CONFIG))
+
+    def readfp(self, fp: IO[bytes]):
+        """Read a config file from binary file-like object `fp`."""
+        # The default config does not need to be parsed, so the TOML parser is
+        # only imported when reading a config file.
+        # pylint: disable=import-outside-toplevel
+        if sys.version_info >= (3, 11):
+            import tomllib
+        else:
+            import tomli as tomllib
 
-    def readfp(self, fp: IO[Any]):
-        """Read a config file from file-like object `fp`."""
-        data: dict[str, Any] = toml.load(fp)
+        self._read_data(tomllib.loads(fp.read().decode()))
 
-        try:
-            languages = data.pop("language")
-        except KeyError:
-            pass
-        else:
+    def _read_data(self, data: dict[str, Any]):
+        """Merge the parsed config `data` into this configuration."""
+        self._languages.clear()
+
+        languages = data.pop("language", None)
+        if languages is not None:
             for language_name, language_data in languages.items():
                 if language_name not in self._config["language"]:
                     self._config["language"][language_name] = {}
 
                 self._config["language"][language_name].update(language_data)
+                self._compiled_patterns.pop(language_name, None)
 
-                for extension in language_data["extensions"]:
+                for extension in language_data.get("extensions", ()):
                     self._extensions[extension] = language_name
 
-        try:
-            general = data.pop("general")
-        except KeyError:
-            pass
-        else:
+        general = data.pop("general", None)
+        if general is not None:
             self._config["general"].update(general)
+            self._compiled_patterns.clear()
 
         if data:
             raise ValueError("Unknown data in configuration file")
@@ -141,18 +169,27 @@ class Config:
         """
         Return the `LanguageInfo` object for the given extension.
 
+        The object is built once per extension until the configuration changes.
+        Each call returns a copy, so callers may modify it freely.
+
         Raises a `LookupError` is the extension is not registered.
         """
-        try:
-            language_name = self._extensions[extension]
-        except KeyError as exc:
-            raise LookupError(
-                f"No language registered for extension {extension}"
-            ) from exc
-
-        language_data = ChainMap(
-            self._config["language"][language_name],
-            self._config["general"],
-        )
+        language = self._languages.get(extension)
+        if language is not None:
+            return dataclasses.replace(language)
+
+        language_name = self._extensions.get(extension)
+        if language_name is None:
+            raise LookupError(f"No language registered for extension {extension}")
 
-        return get_language_from_mapping(language_data)
+        language_data = {
+            **self._config["general"],
+            **self._config["language"][language_name],
+        }
+
+        language = get_language_from_mapping(
+            language_data,
+            compiled_patterns=self._compiled_patterns.setdefault(language_name, {}),
+        )
+        self._languages[extension] = language
+        return dataclasses.replace(language)
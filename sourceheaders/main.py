@@ -25,14 +25,84 @@
 
 """ Command line interface. """
 import argparse
+import datetime
 import logging
 import pathlib
 from typing import TYPE_CHECKING, Optional
 
 from .config import Config
+from .parser import LanguageInfo
 
 if TYPE_CHECKING:
-    from collections.abc import Sequence
+    from collections.abc import Iterable, Sequence
+    from concurrent.futures import Future
+
+logger = logging.getLogger(__name__)
+
+
+def update_file(
+    path: pathlib.Path,
+    lang: LanguageInfo,
+    year: int,
+    default_header: Optional[str] = None,
+) -> bool:
+    """
+    Update the header of the file at `path` and return `True` if it was replaced.
+
+    If the file already starts with `default_header` (followed by an empty
+    line), it is left untouched.
+    """
+    with path.open("r+", encoding="utf-8") as fp:
+        if default_header is None:
+            content = fp.read()
+        else:
+            # Only read the beginning of the file first. If the file is
+            # already up to date, the rest does not need to be read at all.
+            head = fp.read(len(default_header) + 1)
+            if head in (default_header, default_header + "\n"):
+                return True
+            content = head + fp.read()
+
+        (replaced, new_content) = lang.update_header(content, year=year)
+        if new_content != content:
+            fp.seek(0)
+            fp.write(new_content)
+            fp.truncate()
+
+    return replaced
+
+
+def get_languages(
+    config: Config, suffixes: "Iterable[str]", year: int
+) -> dict[str, tuple[LanguageInfo, Optional[str]]]:
+    """
+    Look up the language for each of the given file `suffixes`.
+
+    Returns a mapping of each supported suffix to a tuple of the language and
+    the header for files without an existing header.
+    """
+    languages: dict[str, tuple[LanguageInfo, Optional[str]]] = {}
+    for suffix in suffixes:
+        try:
+            lang = config.get_language(extension=suffix)
+        except LookupError:
+            continue
+
+        languages[suffix] = (lang, lang.get_default_header_text(year=year))
+
+    return languages
+
+
+def positive_int(value: str) -> int:
+    """Parse a command line argument that must be a positive integer."""
+    error = argparse.ArgumentTypeError(f"must be a positive integer: {value!r}")
+    try:
+        number = int(value)
+    except ValueError as exc:
+        raise error from exc
+    if number < 1:
+        raise error
+    return number
 
 
 def main(argv: Optional["Sequence[str]"] = None) -> int:
@@ -40,8 +110,6 @@ def main(argv: Optional["Sequence[str]"] = None) -> int:
 
     logging.basicConfig(format="%(message)s", level=logging.INFO)
 
-    logger = logging.getLogger(__name__)
-
     parser = argparse.ArgumentParser()
     parser.add_argument(
         "-c",
@@ -49,6 +117,18 @@ def main(argv: Optional["Sequence[str]"] = None) -> int:
         type=pathlib.Path,
         default=pathlib.Path.cwd().joinpath(".sourceheaders.toml"),
     )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=positive_int,
+        default=None,
+        help="maximum number of worker threads or processes",
+    )
+    parser.add_argument(
+        "--processes",
+        action="store_true",
+        help="use worker processes instead of threads",
+    )
     parser.add_argument("file", nargs="+", type=pathlib.Path)
     args = parser.parse_args(argv)
 
@@ -60,24 +140,34 @@ def main(argv: Optional["Sequence[str]"] = None) -> int:
 
     config.read(str(args.config))
 
-    for path in args.file:
-        try:
-            lang = config.get_language(extension=path.suffix)
-        except LookupError:
-            logger.warning("Failed to detect comment style for %s", path)
-            continue
-
-        with path.open("r", encoding="utf-8") as fp:
-            content = fp.read()
+    # Only import the thread pool once it is clear that there is work to do.
+    import concurrent.futures  # pylint: disable=import-outside-toplevel
 
-        (replaced, new_content) = lang.update_header(content)
+    year = datetime.date.today().year
+    suffixes = [path.suffix for path in args.file]
 
-        with path.open("w+", encoding="utf-8") as fp:
-            fp.write(new_content)
+    languages = get_languages(config, set(suffixes), year)
 
-        if replaced:
-            logger.info("Replaced header in %s", path)
-        else:
-            logger.info("Added header to %s", path)
+    executor_class: type[concurrent.futures.Executor] = (
+        concurrent.futures.ProcessPoolExecutor
+        if args.processes
+        else concurrent.futures.ThreadPoolExecutor
+    )
+    with executor_class(max_workers=args.jobs) as executor:
+        # Files are processed concurrently, but results are reported in the
+        # order in which they were passed on the command line.
+        futures: list[Optional["Future[bool]"]] = [
+            executor.submit(update_file, path, language[0], year, language[1])
+            if (language := languages.get(suffix)) is not None
+            else None
+            for path, suffix in zip(args.file, suffixes)
+        ]
+        for path, future in zip(args.file, futures):
+            if future is None:
+                logger.warning("Failed to detect comment style for %s", path)
+            elif future.result():
+                logger.info("Replaced header in %s", path)
+            else:
+                logger.info("Added header to %s", path)
 
     return 0
@@ -26,75 +26,142 @@
 """
 Classes and functions related to parsing source files.
 """
-import copy
 import dataclasses
 import datetime
 import enum
-import importlib.resources
+import functools
 import itertools
 import re
 import textwrap
-from typing import Any, Callable, Iterable, NamedTuple, Optional
+from typing import Iterable, Iterator, NamedTuple, Optional
 
 DUMMY_SPDX_LICENSE_IDENTIFIER = "NOASSERTION"
-
-
-def takefrom(pred: Callable[[Any], bool], iterable: Iterable[Any]) -> Any:
+# Matches lines like "Copyright (c) 2020-2022 John Doe". The optional
+# "Copyright"/"(c)" prefix does not affect the captured groups, so the pattern
+# starts at the year. The lookahead lets the regex engine skip ahead to the
+# next digits instead of trying the whole pattern at every position.
+COPYRIGHT_PATTERN = re.compile(
+    r"(?=\d{4})"
+    r"(?P<year>(?:(?:\d{4}-)?\d{4},\s*)*(?:\d{4}-)?\d{4})\s+"
+    r"(?P<copyright_holder>.+)",
+    flags=re.DOTALL,
+)
+SPDX_LICENSE_IDENTIFIER_PATTERN = re.compile(
+    r"SPDX-License-Identifier:\s*(?P<license>\S+)", flags=re.IGNORECASE
+)
+YEAR_RANGE_PATTERN = re.compile(r"^(\d{4})-(\d{4})$")
+YEAR_PATTERN = re.compile(r"^(\d{4})$")
+BLANK_LINE_PATTERN = re.compile(r"\s*\Z")
+LINE_BOUNDARY_PATTERN = re.compile(r"\r\n|[\n\r\v\f\x1c\x1d\x1e\x85\u2028\u2029]")
+
+
+def iter_lines(text: str) -> Iterator[str]:
     """
-    Make an iterator that returns elements from the iterable once the predicate is true.
+    Lazily yield the lines of `text`, without line endings.
 
-    Counterpart to `itertools.takewhile`.
+    Lines are split exactly like `str.splitlines()` does, but `text` is only
+    scanned as far as the caller consumes the iterator.
     """
-    for item in iterable:
-        if pred(item):
-            yield item
-            break
+    pos = 0
+    for matchobj in LINE_BOUNDARY_PATTERN.finditer(text):
+        yield text[pos : matchobj.start()]
+        pos = matchobj.end()
 
-    yield from iterable
+    if pos < len(text):
+        yield text[pos:]
 
 
-def parse_prefixed_line(line: str, prefix: Optional[str]) -> Optional[str]:
+def iter_line_ends(text: str) -> Iterator[int]:
     """
-    Return a `line` without `prefix` if `line` starts with `prefix`, else return `None`.
+    Lazily yield the offset after the end of each line in `text`.
+
+    The offsets include the line endings. Lines are split like
+    `str.splitlines()` does.
     """
-    if prefix is None:
-        return None
+    pos = 0
+    for matchobj in LINE_BOUNDARY_PATTERN.finditer(text):
+        pos = matchobj.end()
+        yield pos
 
-    prefix = prefix.rstrip()
+    if pos < len(text):
+        yield len(text)
 
-    if line.startswith(prefix):
-        return line.removeprefix(prefix)
 
-    if line == prefix:
+def join_lines(lines: Iterable[str]) -> str:
+    """
+    Join `lines` into a single string, terminating each line with a newline.
+    """
+    line_list = list(lines)
+    if not line_list:
         return ""
 
-    return None
+    line_list.append("")
+    return "\n".join(line_list)
 
 
-def parse_suffixed_line(line: str, suffix: Optional[str]) -> Optional[str]:
+@functools.lru_cache(maxsize=None)
+def compile_skip_line_pattern(skip_line: Optional[re.Pattern[str]]) -> re.Pattern[str]:
     """
-    Return a `line` without `suffix` if `line` starts with `suffix`, else return `None`.
+    Return a pattern that matches lines to skip at the beginning of a file.
+
+    These are empty lines and lines that match the `skip_line` pattern (e.g.
+    shebang lines), so that a single regex match decides whether to skip.
     """
-    if suffix is None:
-        return None
+    if skip_line is None:
+        return BLANK_LINE_PATTERN
+
+    # The skip_line pattern is kept in front, because it may start with
+    # global inline flags. In verbose mode, it may also end with a comment.
+    separator = "\n|" if skip_line.flags & re.VERBOSE else "|"
+    return re.compile(
+        f"{skip_line.pattern}{separator}{BLANK_LINE_PATTERN.pattern}",
+        flags=skip_line.flags,
+    )
 
-    suffix = suffix.rstrip()
 
-    if line.endswith(suffix):
-        return line.removesuffix(suffix)
+@functools.lru_cache(maxsize=None)
+def compile_continuation_pattern(
+    prefix: Optional[str], suffix: Optional[str] = None
+) -> re.Pattern[str]:
+    """
+    Return a pattern that matches continuation lines of a comment.
 
-    if line == suffix:
-        return ""
+    The pattern matches lines starting with `prefix` (or any line if `prefix`
+    is `None`) and puts the rest of the line into the `content` group. If
+    `suffix` is given, lines that end with `suffix` are matched too, and
+    everything before the suffix is put into the `end` group instead.
+    """
+    pattern = rf"{re.escape(prefix or '')}(?P<content>.*)"
+    if suffix is not None:
+        pattern = rf"(?P<end>.*){re.escape(suffix)}\Z|{pattern}"
+    return re.compile(pattern, flags=re.DOTALL)
 
-    return None
+
+@functools.lru_cache(maxsize=None)
+def get_text_wrapper(width: int, line_prefix: str) -> textwrap.TextWrapper:
+    """
+    Return a `TextWrapper` that wraps text to `width` and prefixes each line.
+
+    Wrappers are shared between calls, which is safe because `wrap()` does not
+    modify the wrapper.
+    """
+    return textwrap.TextWrapper(
+        width=width,
+        initial_indent=line_prefix,
+        subsequent_indent=line_prefix,
+    )
 
 
+@functools.lru_cache(maxsize=None)
 def get_license_text_from_spdx(spdx_license_identifier: str) -> str:
     """
     Returns license text for the given SPDX-License-Identifier.
 
+    The license text is read from the package data only once per license.
     If the license text is unknown, a `LookupError` is raised.
     """
+    import importlib.resources  # pylint: disable=import-outside-toplevel
+
     ref = importlib.resources.files(__package__).joinpath(
         f"licenses/{spdx_license_identifier}.txt"
     )
@@ -165,7 +232,7 @@ class Header:
         return not any((self.head, self.copyright, self.text, self.tags, self.foot))
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class LanguageInfo:
     """Defined a comment style."""
 
@@ -187,18 +254,6 @@ class LanguageInfo:
     spdx_license_identifier: Optional[str]
     include_spdx_license_identifier: IncludeSpdxIdentifierOption
 
-    def _should_skip_line(self, line: str) -> bool:
-        if not line.strip():
-            # Skip lines at the beginning of the file that are empty.
-            return True
-
-        if self.skip_line is not None and self.skip_line.match(line):
-            # Skip lines at the beginning of the file that have an
-            # allowed value.
-            return True
-
-        return False
-
     def _find_header_lines(self, text: str) -> Iterable[tuple[int, bool, str]]:
         """
         Find lines belonging to the first header comment block.
@@ -206,76 +261,97 @@ class LanguageInfo:
         For each header comment line, this method yields a `(lineno, is_block,
         content)` tuple.
         """
+        # Strip the comment markers once instead of once per line.
+        inline_prefix = (
+            self.inline_comment.rstrip() if self.inline_comment is not None else None
+        )
+        block_start = block_line = block_end = None
+        if self.block_comment is not None:
+            block_start, block_line, block_end = (
+                marker.rstrip() if marker is not None else None
+                for marker in self.block_comment
+            )
+
+        comment_starts = tuple(
+            marker for marker in (block_start, inline_prefix) if marker is not None
+        )
+
+        # Continuation lines are matched with a single regular expression per
+        # line, which also handles the end of block comments.
+        inline_continuation = (
+            compile_continuation_pattern(inline_prefix)
+            if inline_prefix is not None
+            else None
+        )
+        block_continuation = (
+            compile_continuation_pattern(block_line, block_end)
+            if block_line is not None or block_end is not None
+            else None
+        )
+
+        should_skip_line = compile_skip_line_pattern(self.skip_line).match
+
         is_block: Optional[bool] = None
-        for i, line in enumerate(text.splitlines()):
+        for i, line in enumerate(iter_lines(text)):
             if is_block is None:
                 # Comment type is still unknown at this point.
-                if self._should_skip_line(line):
+                if should_skip_line(line):
                     continue
 
-                if (
-                    self.block_comment
-                    and (content := parse_prefixed_line(line, self.block_comment.start))
-                    is not None
-                ):
+                if not line.startswith(comment_starts):
+                    # File does not start with a comment.
+                    return
+
+                if block_start is not None and line.startswith(block_start):
                     # File starts with an block-style comment.
                     is_block = True
+                    content = line.removeprefix(block_start)
 
                     # The block-style comment may end in the same line.
-                    if line := parse_suffixed_line(content, self.block_comment.end):
+                    if (
+                        block_end is not None
+                        and content.endswith(block_end)
+                        and (line := content.removesuffix(block_end))
+                    ):
                         # Block comment ends here.
                         yield (i, is_block, line)
                         return
 
-                    yield (i, is_block, content)
-                elif (
-                    content := parse_prefixed_line(line, self.inline_comment)
-                ) is not None:
-                    # File starts with an block-style comment.
-                    is_block = False
                     yield (i, is_block, content)
                 else:
-                    # File does not start with a comment.
-                    return
+                    # File starts with an inline-style comment.
+                    assert inline_prefix is not None
+                    is_block = False
+                    yield (i, is_block, line.removeprefix(inline_prefix))
 
                 assert is_block is not None
             elif is_block:
-                # Read continuation lines of block-style comment.
-                assert self.block_comment is not None
-                assert (
-                    self.block_comment.line is not None
-                    or self.block_comment.end is not None
-                )
+                # Read continuation lines of block-style comment. If there is
+                # no prefix for individual lines (e.g. for Python-style
+                # multiline comments), every line matches.
+                assert block_continuation is not None
+                if (matchobj := block_continuation.match(line)) is None:
+                    return
+
+                # The pattern only has an `end` group if there is an end marker.
                 if (
-                    self.block_comment.end is not None
-                    and (content := parse_suffixed_line(line, self.block_comment.end))
-                    is not None
+                    block_end is not None
+                    and (content := matchobj.group("end")) is not None
                 ):
                     # Block comment ends here.
                     yield (i, is_block, content)
                     return
 
-                if self.block_comment.line is None:
-                    # Block comment continues here, but there is no prefix for
-                    # inidivual lines (e.g. for Python-style multiline
-                    # comments).
-                    yield (i, is_block, line)
-                elif (
-                    content := parse_prefixed_line(line, self.block_comment.line)
-                ) is not None:
-                    # Block comment continues here.
-                    yield (i, is_block, content)
-                else:
-                    return
+                # Block comment continues here.
+                yield (i, is_block, matchobj.group("content"))
             else:
                 # Read continuation lines of inline-style comment.
-                if (
-                    content := parse_prefixed_line(line, self.inline_comment)
-                ) is not None:
-                    yield (i, is_block, content)
-                else:
+                assert inline_continuation is not None
+                if (matchobj := inline_continuation.match(line)) is None:
                     return
 
+                yield (i, is_block, matchobj.group("content"))
+
     def get_license_text(self) -> str:
         """Return the license text."""
         spdx_license_identifier = self.get_spdx_license_identifier()
@@ -293,9 +369,13 @@ class LanguageInfo:
             or DUMMY_SPDX_LICENSE_IDENTIFIER
         )
 
-    def get_header(self, old_header: Optional[DetectedHeaderComment]) -> Header:
+    def get_header(
+        self, old_header: Optional[DetectedHeaderComment], year: Optional[int] = None
+    ) -> Header:
         """
         Return the configured header text.
+
+        If `year` is `None`, the current year is used.
         """
 
         header = Header()
@@ -307,15 +387,17 @@ class LanguageInfo:
         if not self.preserve_license:
             spdx_license_identifier = None
 
-        year = datetime.date.today().year
+        if year is None:
+            year = datetime.date.today().year
         if old_header and old_header.copyright:
-            header.copyright.extend(copy.copy(c) for c in old_header.copyright)
+            header.copyright.extend(
+                CopyrightEntry(year=c.year, holder=c.holder)
+                for c in old_header.copyright
+            )
 
             if len(header.copyright) == 1:
                 if not self.preserve_copyright_holder:
-                    copyright_entry = header.copyright[0]
-                    copyright_entry.holder = self.copyright_holder
-                    header.copyright = [copyright_entry]
+                    header.copyright[0].holder = self.copyright_holder
 
         if not self.preserve_copyright_years:
             for copyright_entry in reversed(header.copyright):
@@ -327,11 +409,9 @@ class LanguageInfo:
                 if not copyright_entry.year:
                     copyright_entry.year = str(year)
                 else:
-                    if matchobj := re.search(
-                        r"^(\d{4})-(\d{4})$", copyright_entry.year
-                    ):
+                    if matchobj := YEAR_RANGE_PATTERN.match(copyright_entry.year):
                         copyright_entry.year = f"{matchobj.group(1)}-{year}"
-                    elif matchobj := re.match(r"^(\d{4})$", copyright_entry.year):
+                    elif YEAR_PATTERN.match(copyright_entry.year):
                         copyright_entry.year = str(year)
                     else:
                         copyright_entry.year += f", {year}"
@@ -346,9 +426,9 @@ class LanguageInfo:
         )
 
         if (
-            self.include_spdx_license_identifier == IncludeSpdxIdentifierOption.ALWAYS
+            self.include_spdx_license_identifier is IncludeSpdxIdentifierOption.ALWAYS
             or (
-                self.include_spdx_license_identifier == IncludeSpdxIdentifierOption.AUTO
+                self.include_spdx_license_identifier is IncludeSpdxIdentifierOption.AUTO
                 and spdx_license_identifier != DUMMY_SPDX_LICENSE_IDENTIFIER
             )
         ):
@@ -356,7 +436,7 @@ class LanguageInfo:
         else:
             assert (
                 self.include_spdx_license_identifier
-                == IncludeSpdxIdentifierOption.NEVER
+                is IncludeSpdxIdentifierOption.NEVER
             )
 
         if spdx_license_identifier is not None:
@@ -380,30 +460,40 @@ class LanguageInfo:
 
         return header
 
+    def get_default_header_text(self, year: Optional[int] = None) -> Optional[str]:
+        """
+        Return the formatted header for a file that does not have one yet.
+
+        Returns `None` if the header can not be determined from the
+        configuration alone, i.e. if the license text is unknown.
+        """
+        try:
+            get_license_text_from_spdx(self.get_spdx_license_identifier())
+        except LookupError:
+            return None
+
+        header_lines = self.format_header(
+            header=self.get_header(None, year=year),
+            width=self.width,
+            prefer_inline=self.prefer_inline,
+        )
+        return join_lines(header_lines)
+
     def find_header(self, text: str) -> Optional[DetectedHeaderComment]:
         """Find header comment in `text` or return `None`."""
         header_is_block: Optional[bool] = None
-        linerange: Optional[LineRange] = None
+        lineno_start: Optional[int] = None
+        lineno_end = 0
         lines: list[str] = []
         copyright_entries: list[CopyrightEntry] = []
         tags: dict[str, str] = {}
         for lineno, is_block, line in self._find_header_lines(text):
             if header_is_block is None:
                 header_is_block = is_block
-            assert header_is_block is not None
-            assert header_is_block == is_block
-            lineno_start, lineno_end = linerange or LineRange(start=lineno, end=lineno)
-            assert lineno_start <= lineno_end
-            assert lineno_end <= lineno
-            linerange = LineRange(start=lineno_start, end=lineno)
-
-            if matchobj := re.search(
-                r"(?:Copyright\s*)?(?:(?:\(c\)|©)\s*)?"
-                r"(?P<year>(?:(?:\d{4}-)?\d{4},\s*)*(?:\d{4}-)?\d{4})\s+"
-                r"(?P<copyright_holder>.+)",
-                line,
-                flags=(re.DOTALL | re.IGNORECASE),
-            ):
+                lineno_start = lineno
+            lineno_end = lineno
+
+            if matchobj := COPYRIGHT_PATTERN.search(line):
                 copyright_entries.append(
                     CopyrightEntry(
                         year=matchobj.group("year"),
@@ -412,11 +502,7 @@ class LanguageInfo:
                 )
                 continue
 
-            if matchobj := re.search(
-                r"SPDX-License-Identifier:\s*(?P<license>\S+)",
-                line,
-                flags=re.IGNORECASE,
-            ):
+            if matchobj := SPDX_LICENSE_IDENTIFIER_PATTERN.search(line):
                 tags["SPDX-License-Identifier"] = matchobj.group("license")
                 continue
 
@@ -425,12 +511,12 @@ class LanguageInfo:
         if header_is_block is None:
             return None
 
-        assert linerange is not None
-        assert linerange.start <= linerange.end
+        assert lineno_start is not None
+        assert lineno_start <= lineno_end
         assert len(lines) > 0
         return DetectedHeaderComment(
             is_block=header_is_block,
-            linerange=linerange,
+            linerange=LineRange(start=lineno_start, end=lineno_end),
             lines=lines,
             copyright=copyright_entries,
             tags=tags,
@@ -454,31 +540,29 @@ class LanguageInfo:
             if self.block_comment.start:
                 yield self.block_comment.start.rstrip()
 
+        wrapper = get_text_wrapper(width=width, line_prefix=line_prefix)
+
         def format_text(text: str) -> Iterable[str]:
             paragraphs = text.split("\n\n")
 
             for i, paragraph in enumerate(paragraphs, start=1):
-                yield from (
-                    line.rstrip()
-                    for line in textwrap.wrap(
-                        paragraph,
-                        width=width,
-                        initial_indent=line_prefix,
-                        subsequent_indent=line_prefix,
-                    )
-                )
+                yield from (line.rstrip() for line in wrapper.wrap(paragraph))
                 if i < len(paragraphs):
                     yield line_prefix.rstrip()
 
-        if header.head:
+        has_head = bool(header.head)
+        has_copyright = bool(header.copyright)
+        has_text = bool(header.text)
+        has_tags = bool(header.tags)
+        has_foot = bool(header.foot)
+
+        if has_head:
             yield from format_text(header.head)
 
-        if header.head and any(
-            (header.copyright, header.text, header.tags, header.foot)
-        ):
+        if has_head and (has_copyright or has_text or has_tags or has_foot):
             yield line_prefix.rstrip()
 
-        if header.copyright:
+        if has_copyright:
             for copyright_entry in header.copyright:
                 yield from format_text(
                     self.copyright_template.format(
@@ -487,31 +571,24 @@ class LanguageInfo:
                     )
                 )
 
-        if any((header.head, header.copyright)) and any(
-            (header.text, header.tags, header.foot)
-        ):
+        if (has_head or has_copyright) and (has_text or has_tags or has_foot):
             yield line_prefix.rstrip()
 
-        if header.text:
+        if has_text:
             yield from format_text(header.text)
 
-        if any((header.head, header.copyright, header.text)) and any(
-            (header.tags, header.foot)
-        ):
+        if (has_head or has_copyright or has_text) and (has_tags or has_foot):
             yield line_prefix.rstrip()
 
-        if header.tags:
+        if has_tags:
             yield from (
                 f"{line_prefix}{key}: {value}" for key, value in header.tags.items()
             )
 
-        if (
-            any((header.head, header.copyright, header.text, header.tags))
-            and header.foot
-        ):
+        if (has_head or has_copyright or has_text or has_tags) and has_foot:
             yield line_prefix.rstrip()
 
-        if header.foot:
+        if has_foot:
             yield from format_text(header.foot)
 
         if is_block:
@@ -528,38 +605,57 @@ class LanguageInfo:
         """
         Set the header comment of `text` to `header_lines`.
         """
-        old_lines = iter(text.splitlines(keepends=True))
-
         replaced = False
         if old_header is not None:
-            lines_before = itertools.islice(old_lines, old_header.linerange.start)
-            skip = old_header.linerange.end - old_header.linerange.start + 1
-            lines_after = itertools.islice(old_lines, skip, None)
+            # The offsets at which each line starts.
+            offsets = itertools.chain((0,), iter_line_ends(text))
+            start = next(
+                itertools.islice(offsets, old_header.linerange.start, None),
+                len(text),
+            )
+            end = next(
+                itertools.islice(
+                    offsets, old_header.linerange.end - old_header.linerange.start, None
+                ),
+                len(text),
+            )
             replaced = True
         else:
-            old_lines1, old_lines2 = itertools.tee(old_lines)
-            lines_before = itertools.takewhile(self._should_skip_line, old_lines1)
-            lines_after = takefrom(lambda x: not self._should_skip_line(x), old_lines2)
+            # Insert the header after all skippable lines at the beginning.
+            should_skip_line = compile_skip_line_pattern(self.skip_line).match
+            start = 0
+            for line_end in iter_line_ends(text):
+                if not should_skip_line(text[start:line_end]):
+                    break
+                start = line_end
+            end = start
+
             # Add a blank line after the new header comment.
             header_lines = itertools.chain(header_lines, ("",))
 
-        header_lines = map(lambda line: line + "\n", header_lines)
-        lines = itertools.chain(lines_before, header_lines, lines_after)
-        return (replaced, "".join(lines))
+        header = join_lines(header_lines)
+        if end - start == len(header) and text.startswith(header, start):
+            # The header is already up-to-date, so avoid rebuilding the text.
+            return (replaced, text)
+        return (replaced, text[:start] + header + text[end:])
 
-    def update_header(self, text: str) -> tuple[bool, str]:
+    def update_header(self, text: str, year: Optional[int] = None) -> tuple[bool, str]:
         """
         Update the header in `text` and return tuple `(replaced, new_text)`.
+
+        If `year` is `None`, the current year is used.
         """
         old_header = self.find_header(text)
         header_text = self.format_header(
-            header=self.get_header(old_header),
+            header=self.get_header(old_header, year=year),
             width=self.width,
             prefer_inline=self.prefer_inline,
         )
 
         if old_header and not (
-            old_header.copyright or re.search(self.header_pattern, old_header.text())
+            old_header.copyright
+            # pylint: disable-next=no-member
+            or self.header_pattern.search(old_header.text())
         ):
             # The detected comment is apparently not an actual header.
             old_header = None
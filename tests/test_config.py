@@ -0,0 +1,75 @@
+# -*- coding: utf-8 -*-
+# pylint: disable=missing-docstring
+# Copyright (c) 2022-2023 Jan Holthuis <jan.holthuis@rub.de>
+#
+# Permission is hereby granted, free of charge, to any person
+# obtaining a copy of this software and associated documentation files
+# (the "Software"), to deal in the Software without restriction,
+# including without limitation the rights to use, copy, modify, merge,
+# publish, distribute, sublicense, and/or sell copies of the Software,
+# and to permit persons to whom the Software is furnished to do so,
+# subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS
+# BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN
+# ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+# SPDX-License-Identifier: MIT
+
+# The tests compare the internal state of two `Config` objects.
+# pyright: reportPrivateUsage=false
+
+import io
+import unittest
+
+from sourceheaders.config import Config
+from tools.freeze_default_config import PACKAGE_DIR, freeze_config
+
+
+class ConfigTest(unittest.TestCase):
+    def test_frozen_default_config(self):
+        frozen = Config()
+        frozen.read_default()
+        parsed = Config()
+        with PACKAGE_DIR.joinpath("default.toml").open("rb") as fp:
+            parsed.readfp(fp)
+        # If this fails, run `tools/freeze_default_config.py`.
+        # pylint: disable=protected-access
+        self.assertEqual(frozen._config, parsed._config)
+        self.assertEqual(frozen._extensions, parsed._extensions)
+
+    def test_frozen_default_config_is_generated(self):
+        # If this fails, run `tools/freeze_default_config.py`.
+        self.assertEqual(
+            freeze_config(PACKAGE_DIR.joinpath("default.toml")),
+            PACKAGE_DIR.joinpath("_default_config.py").read_text(encoding="utf-8"),
+        )
+
+    def test_language_cache(self):
+        config = Config()
+        config.read_default()
+        lang = config.get_language(".c")
+        self.assertEqual(lang, config.get_language(".c"))
+        self.assertIsNot(lang, config.get_language(".c"))
+
+        lang.width = 10
+        self.assertEqual(config.get_language(".c").width, 70)
+
+        config.readfp(io.BytesIO(b'[general]\nlicense = "MIT"\n'))
+        new_lang = config.get_language(".c")
+        self.assertIsNot(lang, new_lang)
+        self.assertEqual(new_lang.license, "MIT")
+
+    def test_language_override_without_extensions(self):
+        config = Config()
+        config.read_default()
+        config.readfp(io.BytesIO(b"[language.rust]\nwidth = 99\n"))
+        self.assertEqual(config.get_language(".rs").width, 99)
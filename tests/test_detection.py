@@ -30,23 +30,25 @@
 # Hence, we need to disable optional member access reporting here:
 # pyright: reportOptionalMemberAccess=false
 
+import dataclasses
+import itertools
 import textwrap
 import unittest
 
 from sourceheaders.config import Config
-from sourceheaders.parser import CopyrightEntry
-
-HEADER_TEXT = """
-This is the replacement.
-
-It has two paragraphs, one of which contains a very long line that needs to be split into into multiple lines.
-""".strip()
+from sourceheaders.parser import (
+    BlockComment,
+    CopyrightEntry,
+    iter_line_ends,
+    iter_lines,
+)
 
 
 class HeaderDetectionTest(unittest.TestCase):
-    def setUp(self):
-        self.config = Config()
-        self.config.read_default()
+    @classmethod
+    def setUpClass(cls):
+        cls.config = Config()
+        cls.config.read_default()
 
     def detect_header(self, content: str, ext: str):
         lang = self.config.get_language(ext)
@@ -184,3 +186,82 @@ class HeaderDetectionTest(unittest.TestCase):
         header = self.detect_header(content, ".c")
         self.assertIsNotNone(header)
         self.assertEqual(header.tags["SPDX-License-Identifier"], "MPL-2.0")
+
+    def test_copyright_multiple(self):
+        content = """
+        // Copyright (c) 2020 Boaty McBoatface and Friends.
+        // Copyright (c) 2021-2022 John Doe
+        //
+        // Lorem ipsum dolor sit amet, consectetur adipiscing elit, sed do
+        // eiusmod tempor incididunt ut labore et dolore magna aliqua. Ut enim
+        // ad minim veniam, quis nostrud exercitation ullamco laboris nisi ut
+        // aliquip ex ea commodo consequat.
+        //
+        // Copyright 2007 Free Software Foundation, Inc.
+
+        int main() {}
+        """
+        header = self.detect_header(content, ".c")
+        self.assertIsNotNone(header)
+        self.assertEqual(
+            header.copyright,
+            [
+                CopyrightEntry(year="2020", holder="Boaty McBoatface and Friends."),
+                CopyrightEntry(year="2021-2022", holder="John Doe"),
+                CopyrightEntry(year="2007", holder="Free Software Foundation, Inc."),
+            ],
+        )
+
+    def test_copyright_after_text(self):
+        content = """
+        // Copyright (c) 2019 Alice
+        //
+        // Originally written by Carol.
+        //
+        // Copyright (c) 2021 Bob
+        // SPDX-License-Identifier: MIT
+
+        int main() {}
+        """
+        header = self.detect_header(content, ".c")
+        self.assertIsNotNone(header)
+        self.assertEqual(
+            header.copyright,
+            [
+                CopyrightEntry(year="2019", holder="Alice"),
+                CopyrightEntry(year="2021", holder="Bob"),
+            ],
+        )
+
+    def test_block_comment_without_end(self):
+        lang = dataclasses.replace(
+            self.config.get_language(".c"),
+            block_comment=BlockComment(start="/**", line=" *", end=None),
+        )
+        content = textwrap.dedent(
+            """\
+            /** Copyright (c) 2020 Foo
+             * Lorem ipsum dolor sit amet.
+            int x;
+            """
+        )
+        header = lang.find_header(content)
+        self.assertIsNotNone(header)
+        self.assertEqual(header.copyright, [CopyrightEntry(year="2020", holder="Foo")])
+        self.assertEqual(header.text(), " Lorem ipsum dolor sit amet.")
+
+    def test_iter_lines(self):
+        for text in (
+            "",
+            "\n",
+            "foo",
+            "foo\n",
+            "foo\n\nbar",
+            "foo\r\nbar\rbaz\n\r",
+            "foo\x0cbar\x0bbaz\x1cqux\x85quux\u2028corge\u2029",
+        ):
+            self.assertEqual(list(iter_lines(text)), text.splitlines())
+            self.assertEqual(
+                list(iter_line_ends(text)),
+                list(itertools.accumulate(map(len, text.splitlines(keepends=True)))),
+            )
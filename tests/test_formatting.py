@@ -38,9 +38,10 @@ It has two paragraphs, one of which contains a very long line that needs to be s
 
 
 class HeaderFormattingTest(unittest.TestCase):
-    def setUp(self):
-        self.config = Config()
-        self.config.read_default()
+    @classmethod
+    def setUpClass(cls):
+        cls.config = Config()
+        cls.config.read_default()
 
     def replace(self, content: str, expected: str, ext: str):
         lang = self.config.get_language(ext)
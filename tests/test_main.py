@@ -0,0 +1,108 @@
+# -*- coding: utf-8 -*-
+# pylint: disable=missing-docstring
+# Copyright (c) 2022-2023 Jan Holthuis <jan.holthuis@rub.de>
+#
+# Permission is hereby granted, free of charge, to any person
+# obtaining a copy of this software and associated documentation files
+# (the "Software"), to deal in the Software without restriction,
+# including without limitation the rights to use, copy, modify, merge,
+# publish, distribute, sublicense, and/or sell copies of the Software,
+# and to permit persons to whom the Software is furnished to do so,
+# subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS
+# BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN
+# ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+# SPDX-License-Identifier: MIT
+
+import argparse
+import os
+import pathlib
+import tempfile
+import textwrap
+import unittest
+
+from sourceheaders.config import Config
+from sourceheaders.main import positive_int, update_file
+
+YEAR = 2023
+
+
+class UpdateFileTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        config = Config()
+        config.read_default()
+        cls.lang = config.get_language(".c")
+        cls.lang.license = "MIT"
+        cls.lang.copyright_holder = "Jan Holthuis"
+        header = cls.lang.get_default_header_text(year=YEAR)
+        assert header is not None
+        cls.header = header
+
+    def setUp(self):
+        tmpdir = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+        self.addCleanup(tmpdir.cleanup)
+        self.path = pathlib.Path(tmpdir.name).joinpath("test.c")
+
+    def update(self, content: str) -> str:
+        self.path.write_text(content, encoding="utf-8")
+        _, expected = self.lang.update_header(content, year=YEAR)
+        update_file(self.path, self.lang, YEAR, default_header=self.header)
+        actual = self.path.read_text(encoding="utf-8")
+        self.assertEqual(expected, actual)
+        return actual
+
+    def test_up_to_date(self):
+        content = f"{self.header}\nint main() {{}}\n"
+        self.path.write_text(content, encoding="utf-8")
+        # Backdate the file, so that any write would change its mtime.
+        os.utime(self.path, ns=(0, 0))
+        self.assertTrue(
+            update_file(self.path, self.lang, YEAR, default_header=self.header)
+        )
+        self.assertEqual(self.path.stat().st_mtime_ns, 0)
+        self.assertEqual(self.path.read_text(encoding="utf-8"), content)
+
+    def test_without_header(self):
+        actual = self.update("int main() {}\n")
+        self.assertEqual(actual, f"{self.header}\nint main() {{}}\n")
+
+    def test_outdated_header(self):
+        content = textwrap.dedent(
+            """\
+            // Copyright (c) 2019 Jan Holthuis
+            //
+            // SPDX-License-Identifier: MIT
+
+            int main() {}
+            """
+        )
+        actual = self.update(content)
+        self.assertNotEqual(actual, content)
+        self.assertIn(f"Copyright (c) {YEAR} Jan Holthuis", actual)
+
+    def test_header_only(self):
+        actual = self.update(self.header)
+        self.assertEqual(actual, self.header)
+
+
+class PositiveIntTest(unittest.TestCase):
+    def test_valid(self):
+        self.assertEqual(positive_int("1"), 1)
+        self.assertEqual(positive_int("8"), 8)
+
+    def test_invalid(self):
+        for value in ("0", "-1", "two", ""):
+            with self.subTest(value=value):
+                with self.assertRaises(argparse.ArgumentTypeError):
+                    positive_int(value)
@@ -24,33 +24,29 @@
 #
 # SPDX-License-Identifier: MIT
 
-import copy
+import dataclasses
 import datetime
 import textwrap
 import unittest
 
 from sourceheaders.config import Config, LanguageInfo
 
-HEADER_TEXT = """
-This is the replacement.
-
-It has two paragraphs, one of which contains a very long line that needs to be split into into multiple lines.
-""".strip()
 YEAR = datetime.date.today().year
 
 
 class HeaderFormattingTest(unittest.TestCase):
-    def setUp(self):
+    # Allow longer diff output for easier debugging.
+    maxDiff = 1000
+
+    @classmethod
+    def setUpClass(cls):
         config = Config()
         config.read_default()
-        self.lang = config.get_language(".c")
-        self.lang.width = 71
-        self.lang.prefer_inline = True
-        self.lang.license = "GPL-3.0-only"
-        self.lang.copyright_holder = "Jan Holthuis"
-
-        # Allow longer diff output for easier debugging.
-        self.maxDiff = 1000  # pylint: disable=invalid-name
+        cls.lang = config.get_language(".c")
+        cls.lang.width = 71
+        cls.lang.prefer_inline = True
+        cls.lang.license = "GPL-3.0-only"
+        cls.lang.copyright_holder = "Jan Holthuis"
 
     def replace(self, content: str, expected: str, lang: LanguageInfo):
         content = textwrap.dedent(content.strip("\n"))
@@ -90,10 +86,12 @@ class HeaderFormattingTest(unittest.TestCase):
 
         int main() {{}}
         """
-        lang = copy.copy(self.lang)
-        lang.preserve_copyright_holder = False
-        lang.preserve_copyright_years = False
-        lang.preserve_license = False
+        lang = dataclasses.replace(
+            self.lang,
+            preserve_copyright_holder=False,
+            preserve_copyright_years=False,
+            preserve_license=False,
+        )
         self.replace(before, after, lang)
 
     def test_preserve_copyright_holder(self):
@@ -128,10 +126,12 @@ class HeaderFormattingTest(unittest.TestCase):
 
         int main() {{}}
         """
-        lang = copy.copy(self.lang)
-        lang.preserve_copyright_holder = True
-        lang.preserve_copyright_years = False
-        lang.preserve_license = False
+        lang = dataclasses.replace(
+            self.lang,
+            preserve_copyright_holder=True,
+            preserve_copyright_years=False,
+            preserve_license=False,
+        )
         self.replace(before, after, lang)
 
     def test_preserve_copyright_years(self):
@@ -166,10 +166,12 @@ class HeaderFormattingTest(unittest.TestCase):
 
         int main() {}
         """
-        lang = copy.copy(self.lang)
-        lang.preserve_copyright_holder = False
-        lang.preserve_copyright_years = True
-        lang.preserve_license = False
+        lang = dataclasses.replace(
+            self.lang,
+            preserve_copyright_holder=False,
+            preserve_copyright_years=True,
+            preserve_license=False,
+        )
         self.replace(before, after, lang)
 
     def test_preserve_license(self):
@@ -197,10 +199,12 @@ class HeaderFormattingTest(unittest.TestCase):
 
         int main() {{}}
         """
-        lang = copy.copy(self.lang)
-        lang.preserve_copyright_holder = False
-        lang.preserve_copyright_years = False
-        lang.preserve_license = True
+        lang = dataclasses.replace(
+            self.lang,
+            preserve_copyright_holder=False,
+            preserve_copyright_years=False,
+            preserve_license=True,
+        )
         self.replace(before, after, lang)
 
     def test_preserve_all(self):
@@ -228,10 +232,12 @@ class HeaderFormattingTest(unittest.TestCase):
 
         int main() {}
         """
-        lang = copy.copy(self.lang)
-        lang.preserve_copyright_holder = True
-        lang.preserve_copyright_years = True
-        lang.preserve_license = True
+        lang = dataclasses.replace(
+            self.lang,
+            preserve_copyright_holder=True,
+            preserve_copyright_years=True,
+            preserve_license=True,
+        )
         self.replace(before, after, lang)
 
     def test_preserve_all_with_custom_license(self):
@@ -248,10 +254,12 @@ class HeaderFormattingTest(unittest.TestCase):
         int main() {}
         """
         after = before
-        lang = copy.copy(self.lang)
-        lang.preserve_copyright_holder = True
-        lang.preserve_copyright_years = True
-        lang.preserve_license = True
+        lang = dataclasses.replace(
+            self.lang,
+            preserve_copyright_holder=True,
+            preserve_copyright_years=True,
+            preserve_license=True,
+        )
         self.replace(before, after, lang)
 
     def test_preserve_all_with_custom_license_block(self):
@@ -281,10 +289,12 @@ class HeaderFormattingTest(unittest.TestCase):
 
         int main() {}
         """
-        lang = copy.copy(self.lang)
-        lang.preserve_copyright_holder = True
-        lang.preserve_copyright_years = True
-        lang.preserve_license = True
+        lang = dataclasses.replace(
+            self.lang,
+            preserve_copyright_holder=True,
+            preserve_copyright_years=True,
+            preserve_license=True,
+        )
         self.replace(before, after, lang)
 
     def test_update_year_range(self):
@@ -328,8 +338,33 @@ class HeaderFormattingTest(unittest.TestCase):
 
         int main() {{}}
         """
-        lang = copy.copy(self.lang)
-        lang.preserve_copyright_holder = False
-        lang.preserve_copyright_years = False
-        lang.preserve_license = False
+        lang = dataclasses.replace(
+            self.lang,
+            preserve_copyright_holder=False,
+            preserve_copyright_years=False,
+            preserve_license=False,
+        )
         self.replace(before, after, lang)
+
+    def test_default_header_is_up_to_date(self):
+        before = """
+        int main() {}
+        """
+        _, content = self.lang.update_header(before.strip())
+        default_header = self.lang.get_default_header_text()
+        self.assertIsNotNone(default_header)
+        self.assertTrue(content.startswith(f"{default_header}\n"))
+        self.replace(content, content, self.lang)
+
+    def test_unchanged_header_returns_same_text(self):
+        before = """
+        int main() {}
+        """
+        _, content = self.lang.update_header(before.strip())
+        replaced, new_content = self.lang.update_header(content)
+        self.assertTrue(replaced)
+        self.assertIs(new_content, content)
+
+    def test_default_header_unknown_license(self):
+        lang = dataclasses.replace(self.lang, license="LicenseRef-Unknown")
+        self.assertIsNone(lang.get_default_header_text())
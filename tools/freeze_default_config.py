@@ -0,0 +1,96 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# Copyright (c) 2022-2023 Jan Holthuis <jan.holthuis@rub.de>
+#
+# Permission is hereby granted, free of charge, to any person
+# obtaining a copy of this software and associated documentation files
+# (the "Software"), to deal in the Software without restriction,
+# including without limitation the rights to use, copy, modify, merge,
+# publish, distribute, sublicense, and/or sell copies of the Software,
+# and to permit persons to whom the Software is furnished to do so,
+# subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS
+# BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN
+# ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+# SPDX-License-Identifier: MIT
+"""
+Convert the default configuration file into a Python module, so that it does
+not need to be parsed on every invocation.
+"""
+
+import argparse
+import pathlib
+import pprint
+import sys
+import textwrap
+from typing import Optional, Sequence
+
+if sys.version_info >= (3, 11):
+    import tomllib
+else:
+    import tomli as tomllib
+
+PACKAGE_DIR = pathlib.Path(__file__).resolve().parent.parent.joinpath("sourceheaders")
+# `__doc__` is `None` when running with `python -OO`.
+DESCRIPTION = (__doc__ or "").strip()
+
+
+def freeze_config(config_path: pathlib.Path) -> str:
+    """
+    Returns the source code of a Python module containing the parsed config.
+    """
+    with config_path.open(mode="rb") as fp:
+        data = tomllib.load(fp)
+
+    # The generated module is not formatted with black, so pprint's output
+    # is used as-is.
+    config = pprint.pformat(data, width=84, sort_dicts=False)
+    header = PACKAGE_DIR.joinpath("__main__.py").read_text(encoding="utf-8")
+    header = header[: header.index('"""')]
+    return (
+        f"{header}"
+        f'"""\nDefault configuration, generated from `{config_path.name}`.\n\n'
+        "Do not edit this file manually. Instead, edit the TOML file and run\n"
+        '`tools/freeze_default_config.py` to regenerate it.\n"""\n'
+        "# pylint: disable=line-too-long\n"
+        "from typing import Any\n\n"
+        f"DEFAULT_CONFIG: dict[str, Any] = (\n{textwrap.indent(config, '    ')}\n)\n"
+    )
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """Main entry point."""
+
+    parser = argparse.ArgumentParser(description=DESCRIPTION)
+    parser.add_argument(
+        "-i",
+        "--input",
+        type=pathlib.Path,
+        default=PACKAGE_DIR.joinpath("default.toml"),
+    )
+    parser.add_argument(
+        "-o",
+        "--output",
+        type=pathlib.Path,
+        default=PACKAGE_DIR.joinpath("_default_config.py"),
+    )
+    args = parser.parse_args(argv)
+
+    with args.output.open(mode="w", encoding="utf-8") as fp:
+        fp.write(freeze_config(args.input))
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -29,74 +29,121 @@ them to text files.
 """
 
 import argparse
+import concurrent.futures
+import functools
+import gzip
+import http
 import json
 import pathlib
 import sys
-from typing import Iterable, Optional, Sequence
-from urllib.request import urlopen
+from typing import Any, Iterable, Optional, Sequence
+from urllib.error import HTTPError
+from urllib.request import Request, urlopen
 
 URL = "https://raw.githubusercontent.com/spdx/license-list-data/master/"
+# Downloads are bound by network latency, not CPU, so use more threads than cores.
+DEFAULT_JOBS = 16
+# `__doc__` is `None` when running with `python -OO`.
+DESCRIPTION = (__doc__ or "").strip()
+
+
+def fetch_json(path: str, cache_file: Optional[pathlib.Path] = None) -> Any:
+    """
+    Returns the decoded JSON document at `path` relative to `URL`.
+
+    If `cache_file` is given, the document is stored there along with its ETag
+    and only downloaded again if it changed on the server.
+    """
+    request = Request(URL + path, headers={"Accept-Encoding": "gzip"})
+    etag_file = None
+    if cache_file is not None:
+        etag_file = cache_file.with_suffix(".etag")
+        if cache_file.exists() and etag_file.exists():
+            request.add_header("If-None-Match", etag_file.read_text(encoding="utf-8"))
+
+    try:
+        # Despite bandit complaining about a potential vulnerability, use of
+        # `urlopen` is okay here because we use it with a fixed base URL, so
+        # there is no chance of using a file:/ URL or something like that.
+        with urlopen(request) as fp:  # nosec
+            content = fp.read()
+            if fp.headers.get("Content-Encoding") == "gzip":
+                content = gzip.decompress(content)
+            etag = fp.headers.get("ETag")
+    except HTTPError as err:
+        if cache_file is None or err.code != http.HTTPStatus.NOT_MODIFIED:
+            raise
+        content = cache_file.read_bytes()
+    else:
+        if cache_file is not None and etag_file is not None:
+            cache_file.write_bytes(content)
+            if etag:
+                etag_file.write_text(etag, encoding="utf-8")
+            else:
+                etag_file.unlink(missing_ok=True)
+
+    return json.loads(content)
 
 
 def find_licenses() -> Iterable[str]:
     """
     Yields SPDX-License-IDs from the SPDX license-list-data repository on GitHub.
     """
-    # Despite bandit complaining about a potential vulnerability, use of
-    # `urlopen` is okay here because we use it with a fixed base URL, so there
-    # is no chance of using a file:/ URL or something like that.
-    with urlopen(URL + "json/licenses.json") as fp:  # nosec
-        data = json.load(fp)
-        for license_data in data["licenses"]:
-            yield license_data["licenseId"]
+    data = fetch_json("json/licenses.json")
+    for license_data in data["licenses"]:
+        yield license_data["licenseId"]
 
 
-def find_license_header(license_id: str) -> Optional[str]:
+def find_license_header(
+    license_id: str, cache_dir: Optional[pathlib.Path] = None
+) -> Optional[str]:
     """
     Returns the license header text for the given `license_id`.
 
     The data is retrieved from the SPDX license-list-data repository on GitHub.
+    If `cache_dir` is given, downloaded data is cached there between runs.
     """
-    # Despite bandit complaining about a potential vulnerability, use of
-    # `urlopen` is okay here because we use it with a fixed base URL, so there
-    # is no chance of using a file:/ URL or something like that.
-    with urlopen(URL + f"json/details/{license_id}.json") as fp:  # nosec
-        data = json.load(fp)
-        text = data.get("standardLicenseHeader")
-        if text == "none":
-            text = None
-        text = text or data.get("standardLicenseHeaderTemplate")
-        if text == "none":
-            text = None
-
-        if text:
-            text = text.strip()
-            text = text.strip('"')
+    cache_file = None
+    if cache_dir is not None:
+        cache_file = cache_dir.joinpath(f"{license_id}.json")
+    data = fetch_json(f"json/details/{license_id}.json", cache_file=cache_file)
+    for key in ("standardLicenseHeader", "standardLicenseHeaderTemplate"):
+        text = data.get(key)
+        if text and text != "none":
+            return text.strip().strip('"') or None
 
-    return text or None
+    return None
 
 
 def main(argv: Optional[Sequence[str]] = None) -> int:
     """Main entry point."""
 
-    desc = __doc__
-    assert desc is not None  # This makes the type checker happy.
-
-    parser = argparse.ArgumentParser(description=desc.strip())
+    parser = argparse.ArgumentParser(description=DESCRIPTION)
+    parser.add_argument("-j", "--jobs", type=int, default=DEFAULT_JOBS)
+    parser.add_argument("--cache-dir", type=pathlib.Path, default=None)
     parser.add_argument("output_dir", type=pathlib.Path)
     args = parser.parse_args(argv)
 
-    for license_id in find_licenses():
-        license_header = find_license_header(license_id)
-        if not license_header:
-            print(f"[NOTFOUND] {license_id}")
-            continue
-
-        print(f"[   OK   ] {license_id}")
-        with args.output_dir.joinpath(f"{license_id}.txt").open(
-            mode="w", encoding="utf-8"
-        ) as fp:
-            fp.write(license_header)
+    if args.cache_dir is not None:
+        args.cache_dir.mkdir(parents=True, exist_ok=True)
+
+    license_ids = list(find_licenses())
+    with concurrent.futures.ThreadPoolExecutor(max_workers=args.jobs) as executor:
+        # Licenses are downloaded concurrently, but results are reported and
+        # written in the order of the license list.
+        license_headers = executor.map(
+            functools.partial(find_license_header, cache_dir=args.cache_dir),
+            license_ids,
+        )
+        for license_id, license_header in zip(license_ids, license_headers):
+            if not license_header:
+                print(f"[NOTFOUND] {license_id}")
+                continue
+
+            print(f"[   OK   ] {license_id}")
+            args.output_dir.joinpath(f"{license_id}.txt").write_bytes(
+                license_header.encode("utf-8")
+            )
 
     return 0
 